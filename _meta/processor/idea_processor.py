@@ -144,7 +144,6 @@ class IdeaProcessor:
         if isinstance(youtube_shorts_record, dict):
             # For dict, parse JSON if it's a string
             if isinstance(score_dictionary, str):
-                import json
                 try:
                     score_dict = json.loads(score_dictionary) if score_dictionary else {}
                 except json.JSONDecodeError:
@@ -41,10 +41,13 @@ class SourcePlugin(ABC):
     def format_tags(self, tags: List[str]) -> str:
         """Format a list of tags into a comma-separated string.
         
+        Blank tags are dropped and duplicates keep their first position.
+        
         Args:
             tags: List of tag strings
             
         Returns:
             Comma-separated tag string
         """
-        return ",".join(tag.strip() for tag in tags if tag.strip())
+        stripped = (tag.strip() for tag in tags)
+        return ",".join(dict.fromkeys(tag for tag in stripped if tag))
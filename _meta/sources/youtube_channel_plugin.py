@@ -13,6 +13,12 @@ from datetime import datetime
 from mod.sources import SourcePlugin
 
 
+_YOUTUBE_BASE_URL = "https://www.youtube.com/"
+
+# SRT cue numbers and timestamp lines (e.g., '00:00:01,000 --> 00:00:02,000')
+_SRT_METADATA_RE = re.compile(r'^\s*(?:\d+|.*-->.*)\s*$', re.MULTILINE)
+
+
 class YouTubeChannelPlugin(SourcePlugin):
     """Plugin for scraping ideas from YouTube channel Shorts using yt-dlp."""
     
@@ -119,14 +125,14 @@ class YouTubeChannelPlugin(SourcePlugin):
         
         # Channel handle (starts with @)
         if channel_input.startswith('@'):
-            return f"https://www.youtube.com/{channel_input}"
+            return _YOUTUBE_BASE_URL + channel_input
         
         # Channel ID (starts with UC)
         if channel_input.startswith('UC'):
-            return f"https://www.youtube.com/channel/{channel_input}"
+            return f"{_YOUTUBE_BASE_URL}channel/{channel_input}"
         
         # Assume it's a handle without @
-        return f"https://www.youtube.com/@{channel_input}"
+        return f"{_YOUTUBE_BASE_URL}@{channel_input}"
     
     def _get_channel_shorts(self, channel_url: str, top_n: int) -> List[str]:
         """Get list of video IDs from channel shorts.
@@ -183,7 +189,7 @@ class YouTubeChannelPlugin(SourcePlugin):
         Returns:
             Video metadata dictionary or None
         """
-        video_url = f"https://www.youtube.com/watch?v={video_id}"
+        video_url = f"{_YOUTUBE_BASE_URL}watch?v={video_id}"
         
         # Use yt-dlp to get JSON metadata (no download)
         cmd = [
@@ -262,17 +268,9 @@ class YouTubeChannelPlugin(SourcePlugin):
         Returns:
             Plain text of subtitles
         """
-        lines = srt_content.split('\n')
-        text_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            # Skip empty lines, numbers, and timestamp lines
-            if not line or line.isdigit() or '-->' in line:
-                continue
-            text_lines.append(line)
-        
-        return ' '.join(text_lines)
+        # Drop numbers and timestamp lines, then collapse the remaining
+        # text lines (and blank lines) into single spaces
+        return ' '.join(_SRT_METADATA_RE.sub('', srt_content).split())
     
     def _metadata_to_idea(self, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Convert yt-dlp metadata to idea format.
@@ -284,10 +282,19 @@ class YouTubeChannelPlugin(SourcePlugin):
             Idea dictionary
         """
         try:
-            # Calculate engagement metrics
-            view_count = metadata.get('view_count', 0)
-            like_count = metadata.get('like_count', 0)
-            comment_count = metadata.get('comment_count', 0)
+            # Read every field once up front
+            get = metadata.get
+            video_id = get('id')
+            title = get('title', '')
+            description = get('description', '')
+            view_count = get('view_count', 0)
+            like_count = get('like_count', 0)
+            comment_count = get('comment_count', 0)
+            upload_date_str = get('upload_date')
+            width = get('width')
+            height = get('height')
+            categories = get('categories')
+            subtitle_text = get('subtitle_text')
             
             # Calculate engagement rate
             engagement_rate = 0.0
@@ -296,7 +303,6 @@ class YouTubeChannelPlugin(SourcePlugin):
             
             # Calculate views per day
             views_per_day = 0.0
-            upload_date_str = metadata.get('upload_date')
             if upload_date_str and view_count > 0:
                 try:
                     upload_date = datetime.strptime(upload_date_str, '%Y%m%d')
@@ -307,25 +313,23 @@ class YouTubeChannelPlugin(SourcePlugin):
                     pass
             
             # Extract video quality info
-            resolution = f"{metadata.get('width', '?')}x{metadata.get('height', '?')}"
-            fps = metadata.get('fps')
-            aspect_ratio = None
-            if metadata.get('width') and metadata.get('height'):
-                width = metadata['width']
-                height = metadata['height']
-                aspect_ratio = f"{width}:{height}"
+            resolution = (
+                f"{width if 'width' in metadata else '?'}"
+                f"x{height if 'height' in metadata else '?'}"
+            )
+            aspect_ratio = f"{width}:{height}" if width and height else None
             
             # Build comprehensive metrics for UniversalMetrics
             metrics = {
-                'id': metadata.get('id'),
+                'id': video_id,
                 'snippet': {
-                    'title': metadata.get('title', ''),
-                    'description': metadata.get('description', ''),
-                    'publishedAt': metadata.get('upload_date', ''),
-                    'channelId': metadata.get('channel_id'),
-                    'channelTitle': metadata.get('channel', metadata.get('uploader')),
-                    'categoryId': str(metadata.get('categories', [''])[0]) if metadata.get('categories') else None,
-                    'tags': metadata.get('tags', [])
+                    'title': title,
+                    'description': description,
+                    'publishedAt': upload_date_str if 'upload_date' in metadata else '',
+                    'channelId': get('channel_id'),
+                    'channelTitle': get('channel', get('uploader')),
+                    'categoryId': str(categories[0]) if categories else None,
+                    'tags': get('tags', [])
                 },
                 'statistics': {
                     'viewCount': str(view_count),
@@ -334,29 +338,28 @@ class YouTubeChannelPlugin(SourcePlugin):
                     'favoriteCount': '0'
                 },
                 'contentDetails': {
-                    'duration': self._format_duration_iso8601(metadata.get('duration', 0))
+                    'duration': self._format_duration_iso8601(get('duration', 0))
                 },
                 # Additional metrics not in standard YouTube API
                 'enhanced_metrics': {
                     'engagement_rate': engagement_rate,
                     'views_per_day': views_per_day,
                     'resolution': resolution,
-                    'fps': fps,
+                    'fps': get('fps'),
                     'aspect_ratio': aspect_ratio,
-                    'subtitle_text': metadata.get('subtitle_text'),
-                    'subtitles_available': bool(metadata.get('subtitle_text')),
-                    'channel_follower_count': metadata.get('channel_follower_count')
+                    'subtitle_text': subtitle_text,
+                    'subtitles_available': bool(subtitle_text),
+                    'channel_follower_count': get('channel_follower_count')
                 }
             }
             
-
             # Extract tags
             tags = self._extract_tags(metadata)
             
             return {
-                'source_id': metadata.get('id'),
-                'title': metadata.get('title', ''),
-                'description': metadata.get('description', ''),
+                'source_id': video_id,
+                'title': title,
+                'description': description,
                 'tags': tags,
                 'metrics': metrics
             }
@@ -377,13 +380,9 @@ class YouTubeChannelPlugin(SourcePlugin):
         if seconds <= 0:
             return 'PT0S'
         
-        minutes = seconds // 60
-        secs = seconds % 60
-        
-        if minutes > 0:
-            return f"PT{minutes}M{secs}S"
-        else:
-            return f"PT{secs}S"
+        # yt-dlp may report fractional seconds; ISO 8601 output uses whole seconds
+        minutes, secs = divmod(int(seconds), 60)
+        return f"PT{minutes}M{secs}S" if minutes else f"PT{secs}S"
     
     def _extract_tags(self, metadata: Dict[str, Any]) -> str:
         """Extract tags from video metadata.
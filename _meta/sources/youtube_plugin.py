@@ -1,11 +1,17 @@
 """YouTube source plugin for scraping idea inspirations from Shorts."""
 
+import re
+from functools import lru_cache
 from typing import List, Dict, Any
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from mod.sources import SourcePlugin
 
 
+# ISO 8601 durations of at most minutes and seconds (e.g., 'PT2M45S')
+_SHORT_DURATION_RE = re.compile(r'PT(?:(\d+)M)?(?:(\d+)S)?', re.ASCII)
+
+
 class YouTubePlugin(SourcePlugin):
     """Plugin for scraping ideas from YouTube Shorts."""
 
@@ -113,19 +119,21 @@ class YouTubePlugin(SourcePlugin):
         return self.format_tags(tags)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _is_short(duration: str) -> bool:
         """Check if video duration indicates a Short (<= 3 minutes / 180 seconds).
         
+        Results are cached per duration string, since search pages repeat
+        the same durations.
+        
         Args:
             duration: ISO 8601 duration string (e.g., 'PT45S', 'PT1M30S', 'PT2M45S')
             
         Returns:
             True if video is a Short
         """
-        import re
-        
-        # Parse ISO 8601 duration
-        match = re.match(r'PT(?:(\d+)M)?(?:(\d+)S)?', duration)
+        # Parse ISO 8601 duration; anything with hours or days is too long
+        match = _SHORT_DURATION_RE.fullmatch(duration)
         if not match:
             return False
         
@@ -445,13 +445,9 @@ class YouTubeTrendingPlugin(SourcePlugin):
         if seconds <= 0:
             return 'PT0S'
         
-        minutes = seconds // 60
-        secs = seconds % 60
-        
-        if minutes > 0:
-            return f"PT{minutes}M{secs}S"
-        else:
-            return f"PT{secs}S"
+        # yt-dlp may report fractional seconds; ISO 8601 output uses whole seconds
+        minutes, secs = divmod(int(seconds), 60)
+        return f"PT{minutes}M{secs}S" if minutes else f"PT{secs}S"
     
     def _extract_tags(self, metadata: Dict[str, Any]) -> str:
         """Extract tags from video metadata.
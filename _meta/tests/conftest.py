@@ -0,0 +1,44 @@
+"""Shared pytest fixtures for the test suite."""
+
+import pytest
+from sqlalchemy import text
+import db_utils
+from mod.database import Database
+
+
+# Contents of the .env file shared by read-only configuration tests
+ENV_TEMPLATE = (
+    "DATABASE_PATH=test.db\n"
+    "YOUTUBE_API_KEY=test_key\n"
+    "YOUTUBE_MAX_RESULTS=25\n"
+)
+
+
+@pytest.fixture(scope="module")
+def shared_env_file(tmp_path_factory):
+    """Create one .env file per test module from ENV_TEMPLATE.
+    
+    Config only adds WORKING_DIRECTORY, which is the same for every test, so
+    the file can be reused. Tests that need their own .env contents should
+    write one under tmp_path instead.
+    """
+    env_path = tmp_path_factory.mktemp("env") / ".env"
+    env_path.write_text(ENV_TEMPLATE)
+    return str(env_path)
+
+
+@pytest.fixture(scope="module")
+def shared_db():
+    """Create one in-memory database shared by the tests in a module."""
+    db = Database(":memory:", interactive=False, fast=True)
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def temp_db(shared_db):
+    """Provide the shared database with an empty ideas table."""
+    with db_utils.get_connection(shared_db.database_url) as conn:
+        conn.execute(text("DELETE FROM YouTubeShortsSource"))
+        conn.commit()
+    return shared_db
@@ -1,23 +1,14 @@
 """Tests for database module."""
 
 import pytest
-import tempfile
-import os
+import db_utils
 from mod.database import Database
 
 
 @pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.db') as f:
-        db_path = f.name
-    
-    db = Database(db_path, interactive=False)
-    yield db
-    
-    db.close()
-    if os.path.exists(db_path):
-        os.unlink(db_path)
+def db_file_path(tmp_path):
+    """Path to an on-disk database for tests that reopen the file."""
+    return str(tmp_path / "test.db")
 
 
 def test_database_initialization(temp_db):
@@ -95,9 +86,11 @@ def test_get_nonexistent_idea(temp_db):
 def test_get_all_ideas(temp_db):
     """Test retrieving all ideas."""
     # Insert multiple ideas
-    temp_db.insert_idea(source='test1', source_id='1', title='Idea 1', score=90.0)
-    temp_db.insert_idea(source='test1', source_id='2', title='Idea 2', score=70.0)
-    temp_db.insert_idea(source='test2', source_id='3', title='Idea 3', score=80.0)
+    temp_db.insert_ideas([
+        {'source': 'test1', 'source_id': '1', 'title': 'Idea 1', 'score': 90.0},
+        {'source': 'test1', 'source_id': '2', 'title': 'Idea 2', 'score': 70.0},
+        {'source': 'test2', 'source_id': '3', 'title': 'Idea 3', 'score': 80.0},
+    ])
     
     ideas = temp_db.get_all_ideas()
     assert len(ideas) == 3
@@ -106,19 +99,34 @@ def test_get_all_ideas(temp_db):
 def test_get_all_ideas_with_limit(temp_db):
     """Test retrieving ideas with limit."""
     # Insert multiple ideas
-    for i in range(10):
-        temp_db.insert_idea(source='test', source_id=str(i), title=f'Idea {i}', score=float(i))
+    temp_db.insert_ideas([
+        {'source': 'test', 'source_id': str(i), 'title': f'Idea {i}', 'score': float(i)}
+        for i in range(10)
+    ])
     
     ideas = temp_db.get_all_ideas(limit=5)
     assert len(ideas) == 5
 
 
-def test_context_manager(temp_db):
-    """Test database context manager."""
-    db_path = temp_db.db_path
-    temp_db.close()
+def test_insert_ideas_updates_existing(temp_db):
+    """Test that batch insert updates existing and repeated ideas."""
+    temp_db.insert_idea(source='test', source_id='1', title='Original', score=10.0)
     
-    with Database(db_path, interactive=False) as db:
+    inserted = temp_db.insert_ideas([
+        {'source': 'test', 'source_id': '1', 'title': 'Updated', 'score': 20.0},
+        {'source': 'test', 'source_id': '2', 'title': 'New', 'score_dictionary': {'views': 5}},
+        {'source': 'test', 'source_id': '2', 'title': 'New again', 'score': 30.0},
+    ])
+    
+    assert inserted == 1
+    assert temp_db.count_ideas() == 2
+    assert temp_db.get_idea('test', '1')['title'] == 'Updated'
+    assert temp_db.get_idea('test', '2')['title'] == 'New again'
+
+
+def test_context_manager(db_file_path):
+    """Test database context manager."""
+    with Database(db_file_path, interactive=False, fast=True) as db:
         success = db.insert_idea(
             source='test',
             source_id='context',
@@ -129,7 +137,86 @@ def test_context_manager(temp_db):
     # Verify connection is closed
     # Note: We can't directly test if connection is closed in SQLite
     # but we can verify data was saved
-    db2 = Database(db_path, interactive=False)
+    db2 = Database(db_file_path, interactive=False)
     idea = db2.get_idea('test', 'context')
     assert idea is not None
     db2.close()
+
+
+def test_fast_mode_disables_sync(db_file_path):
+    """Test that fast mode turns off synchronous writes for the connection."""
+    with Database(db_file_path, interactive=False, fast=True) as db:
+        with db_utils.get_connection(db.database_url) as conn:
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 0
+            assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -65536
+
+
+def test_schema_initialized_once_per_engine(db_file_path, monkeypatch):
+    """Test that the schema is only created again after the engine is disposed."""
+    db = Database(db_file_path, interactive=False)
+    
+    calls = []
+    monkeypatch.setattr(db_utils.MetaData, "create_all", lambda self, engine: calls.append(engine))
+    
+    db_utils.init_database(db.database_url)
+    assert calls == []
+    
+    db.close()
+    db_utils.init_database(db.database_url)
+    assert len(calls) == 1
+    db_utils.dispose_engine(db.database_url)
+
+
+def test_unique_index_added_to_legacy_database(db_file_path, caplog):
+    """Test that opening a pre-index database with duplicate ideas keeps the newest copy."""
+    import sqlite3
+    
+    conn = sqlite3.connect(db_file_path)
+    conn.execute("""
+        CREATE TABLE YouTubeShortsSource (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source VARCHAR(100) NOT NULL,
+            source_id VARCHAR(255) NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            tags TEXT,
+            score FLOAT,
+            score_dictionary TEXT,
+            processed BOOLEAN NOT NULL,
+            created_at DATETIME NOT NULL,
+            updated_at DATETIME NOT NULL
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO YouTubeShortsSource (source, source_id, title, processed, created_at, updated_at) "
+        "VALUES (?, ?, ?, 0, '2024-01-01', '2024-01-01')",
+        [('youtube', 'abc', 'Old'), ('youtube', 'abc', 'New'), ('youtube', 'xyz', 'Other')]
+    )
+    conn.commit()
+    conn.close()
+    
+    with caplog.at_level('WARNING', logger=db_utils.__name__):
+        db = Database(db_file_path, interactive=False)
+    
+    with db:
+        assert db.count_ideas() == 2
+        survivor = db.get_idea('youtube', 'abc')
+        assert survivor['id'] == 2
+        assert survivor['title'] == 'New'
+        assert db.get_idea('youtube', 'xyz')['id'] == 3
+        assert "Removed 1 duplicate idea row(s)" in caplog.text
+        
+        with db_utils.get_connection(db.database_url) as conn:
+            indexes = {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='index'")}
+        assert 'ix_source_source_id' in indexes
+
+
+def test_close_keeps_engine_for_other_instances(temp_db):
+    """Test that closing one Database leaves other instances on the same URL usable."""
+    temp_db.insert_idea(source='test', source_id='1', title='Kept')
+    
+    other = Database(":memory:", interactive=False)
+    other.close()
+    other.close()  # closing twice must not release the shared database's engine
+    
+    assert temp_db.count_ideas() == 1
@@ -1,12 +1,11 @@
 """Test database security and input validation."""
 
 import pytest
-from mod.database import Database
 
 
-def test_order_by_validation():
+def test_order_by_validation(temp_db):
     """Test that order_by parameter is properly validated."""
-    db = Database(":memory:", interactive=False)
+    db = temp_db
     
     # Insert test data
     db.insert_idea(
@@ -38,9 +37,9 @@ def test_order_by_validation():
         db.get_all_ideas(order_by="score INVALID")
 
 
-def test_sql_injection_prevention():
+def test_sql_injection_prevention(temp_db):
     """Test that SQL injection is prevented in order_by parameter."""
-    db = Database(":memory:", interactive=False)
+    db = temp_db
     
     db.insert_idea(
         source="test",
@@ -68,9 +67,9 @@ def test_sql_injection_prevention():
             pass
 
 
-def test_limit_validation():
+def test_limit_validation(temp_db):
     """Test that limit parameter is properly validated."""
-    db = Database(":memory:", interactive=False)
+    db = temp_db
     
     db.insert_idea(
         source="test",
@@ -94,18 +93,15 @@ def test_limit_validation():
         db.get_all_ideas(limit="invalid")
 
 
-def test_order_by_edge_cases():
+def test_order_by_edge_cases(temp_db):
     """Test edge cases in order_by parameter."""
-    db = Database(":memory:", interactive=False)
+    db = temp_db
     
     # Insert test data
-    for i in range(3):
-        db.insert_idea(
-            source="test",
-            source_id=str(i),
-            title=f"Test Idea {i}",
-            score=float(i)
-        )
+    db.insert_ideas([
+        {"source": "test", "source_id": str(i), "title": f"Test Idea {i}", "score": float(i)}
+        for i in range(3)
+    ])
     
     # Empty string should use default
     ideas = db.get_all_ideas(order_by="")
@@ -33,16 +33,16 @@ def test_calculate_derived_metrics():
     metrics.calculate_derived_metrics()
     
     # Engagement rate = (500 + 50 + 25) / 10000 * 100 = 5.75%
-    assert metrics.engagement_rate == pytest.approx(5.75, rel=0.01)
+    assert metrics.engagement_rate == 5.75
     
     # Like to view ratio = 500 / 10000 * 100 = 5%
-    assert metrics.like_to_view_ratio == pytest.approx(5.0, rel=0.01)
+    assert metrics.like_to_view_ratio == 5.0
     
     # Comment to view ratio = 50 / 10000 * 100 = 0.5%
-    assert metrics.comment_to_view_ratio == pytest.approx(0.5, rel=0.01)
+    assert metrics.comment_to_view_ratio == 0.5
     
     # Share to view ratio = 25 / 10000 * 100 = 0.25%
-    assert metrics.share_to_view_ratio == pytest.approx(0.25, rel=0.01)
+    assert metrics.share_to_view_ratio == 0.25
 
 
 def test_from_youtube():
@@ -82,6 +82,27 @@ def test_from_youtube():
     assert metrics.engagement_rate is not None
 
 
+def test_from_youtube_with_numeric_statistics():
+    """Test that already-parsed integer statistics are accepted as-is."""
+    youtube_data = {
+        'id': 'test_video_id',
+        'snippet': {'title': 'Test Video Title'},
+        'statistics': {
+            'viewCount': 10000,
+            'likeCount': 500,
+            'commentCount': None,
+            'favoriteCount': '10'
+        }
+    }
+    
+    metrics = UniversalMetrics.from_youtube(youtube_data)
+    
+    assert metrics.view_count == 10000
+    assert metrics.like_count == 500
+    assert metrics.comment_count == 0
+    assert metrics.favorite_count == 10
+
+
 def test_from_reddit():
     """Test creating metrics from Reddit data."""
     reddit_data = {
@@ -125,6 +146,22 @@ def test_to_dict_excludes_none():
     assert 'upvote_count' not in metrics_dict
 
 
+def test_to_dict_copies_containers():
+    """Test that mutating the to_dict result leaves the metrics unchanged."""
+    metrics = UniversalMetrics(
+        platform="youtube",
+        categories=['22'],
+        platform_specific={'video_id': 'abc'}
+    )
+    
+    metrics_dict = metrics.to_dict()
+    metrics_dict['categories'].append('10')
+    metrics_dict['platform_specific']['video_id'] = 'changed'
+    
+    assert metrics.categories == ['22']
+    assert metrics.platform_specific == {'video_id': 'abc'}
+
+
 def test_views_per_day_calculation():
     """Test views per day calculation."""
     metrics = UniversalMetrics(
@@ -54,6 +54,12 @@ class TestYouTubePluginShortDuration:
         assert YouTubePlugin._is_short('INVALID') == False
         assert YouTubePlugin._is_short('') == False
     
+    def test_is_short_with_hours(self):
+        """Test that durations with an hour component are not Shorts."""
+        assert YouTubePlugin._is_short('PT1H') == False
+        assert YouTubePlugin._is_short('PT1H2M3S') == False
+        assert YouTubePlugin._is_short('P1DT30S') == False
+    
     def test_is_short_boundary_values(self):
         """Test boundary values around 180 second limit."""
         # Values right at the boundary
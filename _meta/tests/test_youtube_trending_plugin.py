@@ -0,0 +1,26 @@
+"""Tests for YouTube trending plugin."""
+
+import pytest
+from unittest.mock import Mock, patch
+from mod.sources.youtube_trending_plugin import YouTubeTrendingPlugin
+
+
+@pytest.fixture
+def plugin():
+    """Provide a trending plugin with a mock config and yt-dlp assumed installed."""
+    with patch.object(YouTubeTrendingPlugin, '_check_ytdlp', return_value=True):
+        yield YouTubeTrendingPlugin(Mock())
+
+
+class TestYouTubeTrendingPlugin:
+    """Test YouTube trending plugin functionality."""
+    
+    def test_format_duration_iso8601(self, plugin):
+        """Test ISO 8601 duration formatting."""
+        # Test various durations
+        assert plugin._format_duration_iso8601(0) == "PT0S"
+        assert plugin._format_duration_iso8601(45) == "PT45S"
+        assert plugin._format_duration_iso8601(60) == "PT1M0S"
+        assert plugin._format_duration_iso8601(90) == "PT1M30S"
+        assert plugin._format_duration_iso8601(180) == "PT3M0S"
+        assert plugin._format_duration_iso8601(90.5) == "PT1M30S"
@@ -14,6 +14,65 @@ import db_utils
 from processor.idea_processor import IdeaProcessor
 
 
+def _to_idea_rows(ideas, source):
+    """Convert scraped ideas into database rows with universal metrics.
+    
+    Ideas that cannot be converted are reported and skipped, so one bad video
+    does not fail the whole batch (see also _save_ideas()).
+    
+    Args:
+        ideas: Ideas returned by a YouTube plugin
+        source: Source name to store with each idea
+        
+    Returns:
+        List of idea dictionaries for Database.insert_ideas()
+    """
+    rows = []
+    for idea in ideas:
+        try:
+            # Convert platform metrics to universal metrics
+            universal_metrics = UniversalMetrics.from_youtube(idea['metrics'])
+            rows.append({
+                'source': source,
+                'source_id': idea['source_id'],
+                'title': idea['title'],
+                'description': idea['description'],
+                'tags': idea['tags'],
+                'score': universal_metrics.engagement_rate or 0.0,  # Use engagement rate as score
+                'score_dictionary': universal_metrics.to_dict(),
+            })
+        except Exception as e:
+            click.echo(f"Skipping idea {idea.get('source_id', '?')}: {e}", err=True)
+    return rows
+
+
+def _save_ideas(db, rows):
+    """Save idea rows, falling back to one row at a time if the batch fails.
+    
+    Database.insert_ideas() writes the batch in a single transaction, so one
+    row the database rejects would otherwise discard every other idea.
+    
+    Args:
+        db: Open Database instance
+        rows: Idea dictionaries from _to_idea_rows()
+        
+    Returns:
+        Number of new ideas saved
+    """
+    try:
+        return db.insert_ideas(rows)
+    except Exception as e:
+        click.echo(f"Batch save failed ({e}), retrying ideas one by one", err=True)
+    
+    total_saved = 0
+    for row in rows:
+        try:
+            total_saved += db.insert_ideas([row])
+        except Exception as e:
+            click.echo(f"Skipping idea {row.get('source_id', '?')}: {e}", err=True)
+    return total_saved
+
+
 @click.group()
 @click.version_option(version='1.0.0')
 def main():
@@ -67,24 +126,8 @@ def scrape(env_file, no_interactive):
             total_scraped = len(ideas)
             click.echo(f"Found {len(ideas)} ideas from YouTube Shorts")
             
-            # Process and save each idea
-            for idea in ideas:
-                # Convert platform metrics to universal metrics
-                universal_metrics = UniversalMetrics.from_youtube(idea['metrics'])
-                
-                # Save to database with universal metrics
-                success = db.insert_idea(
-                    source='youtube',
-                    source_id=idea['source_id'],
-                    title=idea['title'],
-                    description=idea['description'],
-                    tags=idea['tags'],
-                    score=universal_metrics.engagement_rate or 0.0,  # Use engagement rate as score
-                    score_dictionary=universal_metrics.to_dict()
-                )
-                
-                if success:
-                    total_saved += 1
+            # Save all ideas with universal metrics in one transaction
+            total_saved = _save_ideas(db, _to_idea_rows(ideas, 'youtube'))
             
         except Exception as e:
             click.echo(f"Error scraping YouTube Shorts: {e}", err=True)
@@ -158,24 +201,8 @@ def scrape_channel(env_file, channel, top, no_interactive):
             total_scraped = len(ideas)
             click.echo(f"\nFound {len(ideas)} shorts from channel")
             
-            # Process and save each idea
-            for idea in ideas:
-                # Convert platform metrics to universal metrics
-                universal_metrics = UniversalMetrics.from_youtube(idea['metrics'])
-                
-                # Save to database with universal metrics
-                success = db.insert_idea(
-                    source='youtube_channel',
-                    source_id=idea['source_id'],
-                    title=idea['title'],
-                    description=idea['description'],
-                    tags=idea['tags'],
-                    score=universal_metrics.engagement_rate or 0.0,
-                    score_dictionary=universal_metrics.to_dict()
-                )
-                
-                if success:
-                    total_saved += 1
+            # Save all ideas with universal metrics in one transaction
+            total_saved = _save_ideas(db, _to_idea_rows(ideas, 'youtube_channel'))
             
         except Exception as e:
             click.echo(f"Error scraping YouTube channel: {e}", err=True)
@@ -241,24 +268,8 @@ def scrape_trending(env_file, top, no_interactive):
             total_scraped = len(ideas)
             click.echo(f"\nFound {len(ideas)} shorts from trending")
             
-            # Process and save each idea
-            for idea in ideas:
-                # Convert platform metrics to universal metrics
-                universal_metrics = UniversalMetrics.from_youtube(idea['metrics'])
-                
-                # Save to database with universal metrics
-                success = db.insert_idea(
-                    source='youtube_trending',
-                    source_id=idea['source_id'],
-                    title=idea['title'],
-                    description=idea['description'],
-                    tags=idea['tags'],
-                    score=universal_metrics.engagement_rate or 0.0,
-                    score_dictionary=universal_metrics.to_dict()
-                )
-                
-                if success:
-                    total_saved += 1
+            # Save all ideas with universal metrics in one transaction
+            total_saved = _save_ideas(db, _to_idea_rows(ideas, 'youtube_trending'))
             
         except Exception as e:
             click.echo(f"Error scraping YouTube trending: {e}", err=True)
@@ -325,24 +336,8 @@ def scrape_keyword(env_file, keyword, top, no_interactive):
             total_scraped = len(ideas)
             click.echo(f"\nFound {len(ideas)} shorts for keyword: '{keyword}'")
             
-            # Process and save each idea
-            for idea in ideas:
-                # Convert platform metrics to universal metrics
-                universal_metrics = UniversalMetrics.from_youtube(idea['metrics'])
-                
-                # Save to database with universal metrics
-                success = db.insert_idea(
-                    source='youtube_keyword',
-                    source_id=idea['source_id'],
-                    title=idea['title'],
-                    description=idea['description'],
-                    tags=idea['tags'],
-                    score=universal_metrics.engagement_rate or 0.0,
-                    score_dictionary=universal_metrics.to_dict()
-                )
-                
-                if success:
-                    total_saved += 1
+            # Save all ideas with universal metrics in one transaction
+            total_saved = _save_ideas(db, _to_idea_rows(ideas, 'youtube_keyword'))
             
         except Exception as e:
             click.echo(f"Error scraping YouTube keyword: {e}", err=True)
@@ -557,11 +552,10 @@ def clear(env_file, no_interactive):
         config = Config(env_file, interactive=not no_interactive)
         
         # Delete database file
-        db_path = Path(config.database_path)
-        if db_path.exists():
-            db_path.unlink()
+        try:
+            Path(config.database_path).unlink()
             click.echo(f"Database cleared: {config.database_path}")
-        else:
+        except FileNotFoundError:
             click.echo("Database does not exist.")
         
     except Exception as e:
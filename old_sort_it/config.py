@@ -1,25 +1,53 @@
 """Configuration management for PrismQ.IdeaInspiration.Sources.Content.Shorts.YouTubeShortsSource."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
-from dotenv import load_dotenv, set_key
+
+from dotenv import dotenv_values
+from dotenv.parser import parse_stream
+
+
+@lru_cache(maxsize=32)
+def _find_prismq_root(cwd: str) -> Path:
+    """Find the topmost directory named exactly 'PrismQ' above ``cwd``.
+    
+    The search only inspects path components, so results are memoized per
+    working directory.
+    
+    Args:
+        cwd: Absolute path of the directory to search from
+        
+    Returns:
+        Path to the topmost PrismQ directory, or ``cwd`` if none found
+    """
+    current_path = Path(cwd)
+    
+    # Parents are ordered nearest-first, so walk from the filesystem root down
+    for path in reversed((current_path, *current_path.parents)):
+        if path.name == "PrismQ":
+            return path
+    
+    return current_path
 
 
 class Config:
     """Manages application configuration from environment variables."""
 
-    def __init__(self, env_file: Optional[str] = None, interactive: bool = True):
+    def __init__(self, env_file: Optional[str] = None, interactive: bool = True,
+                 cwd: Optional[str] = None):
         """Initialize configuration.
         
         Args:
             env_file: Path to .env file (default: .env in topmost PrismQ directory)
             interactive: Whether to prompt for missing values (default: True)
+            cwd: Directory to search for PrismQ from (default: current directory)
         """
         # Determine working directory and .env file path
         if env_file is None:
             # Find topmost parent directory with exact name "PrismQ"
-            prismq_dir = self._find_prismq_directory()
+            prismq_dir = self._find_prismq_directory(cwd)
             # Only add _WD suffix if we found a PrismQ directory
             if prismq_dir.name == "PrismQ":
                 working_dir = prismq_dir.parent / "PrismQ_WD"
@@ -36,41 +64,56 @@ class Config:
         
         self.env_file = str(env_file)
         self._interactive = interactive
+        self._pending_writes: Dict[str, str] = {}
         
         # Create .env file if it doesn't exist
         if not Path(self.env_file).exists():
             self._create_env_file()
         
-        # Load environment variables from .env file
-        load_dotenv(self.env_file)
+        # Parse .env file once into a snapshot merged with the process environment
+        self._env = self._read_env()
         
         # Store/update working directory in .env
         self._ensure_working_directory()
         
         # Load configuration with interactive prompting for missing values
         self._load_configuration()
+        
+        # Persist any values gathered above in a single write
+        self._flush_env()
+    
+    def _read_env(self) -> Dict[str, str]:
+        """Parse the .env file and merge it with the process environment.
+        
+        Process environment variables take precedence over values from the
+        .env file, matching ``load_dotenv`` without ``override``.
+        
+        Returns:
+            Snapshot of configuration values keyed by variable name
+        """
+        values = {
+            key: value
+            for key, value in dotenv_values(self.env_file).items()
+            if value is not None
+        }
+        values.update(os.environ)
+        return values
     
-    def _find_prismq_directory(self) -> Path:
+    def _find_prismq_directory(self, cwd: Optional[str] = None) -> Path:
         """Find the topmost/root parent directory with exact name 'PrismQ'.
         
         This searches upward from the current directory and returns the highest-level
         directory with the exact name 'PrismQ'. This ensures that .env files are
         centralized at the root PrismQ directory, not in subdirectories or modules.
         
+        Args:
+            cwd: Directory to search from (default: current directory)
+        
         Returns:
             Path to the topmost PrismQ directory, or current directory if none found
         """
-        current_path = Path.cwd().absolute()
-        prismq_dir = None
-        
-        # Check current directory and all parents, continuing to find the topmost match
-        for path in [current_path] + list(current_path.parents):
-            if path.name == "PrismQ":
-                prismq_dir = path
-                # Continue searching - don't break early
-        
-        # Return the topmost PrismQ directory found, or current directory as fallback
-        return prismq_dir if prismq_dir else current_path
+        start = Path(cwd) if cwd is not None else Path.cwd()
+        return _find_prismq_root(str(start.absolute()))
     
     def _create_env_file(self):
         """Create a new .env file with default values."""
@@ -79,13 +122,60 @@ class Config:
     
     def _ensure_working_directory(self):
         """Ensure working directory is stored in .env file."""
-        current_wd = os.getenv("WORKING_DIRECTORY")
+        current_wd = self._env.get("WORKING_DIRECTORY")
         
         if current_wd != self.working_directory:
             # Update or add working directory to .env
-            set_key(self.env_file, "WORKING_DIRECTORY", self.working_directory)
-            # Reload to pick up the change
-            load_dotenv(self.env_file, override=True)
+            self._set_value("WORKING_DIRECTORY", self.working_directory)
+    
+    def _set_value(self, key: str, value: str):
+        """Set a configuration value and queue it for writing to the .env file.
+        
+        Args:
+            key: Environment variable key
+            value: Value to store
+        """
+        self._env[key] = value
+        self._pending_writes[key] = value
+    
+    def _flush_env(self):
+        """Write all queued values to the .env file in a single pass.
+        
+        Existing lines for queued keys are replaced in place, other lines are
+        preserved verbatim and new keys are appended. Values are quoted the
+        same way as ``dotenv.set_key``.
+        
+        Uses ``dotenv.parser.parse_stream`` so untouched lines keep their
+        original text; that parser is not part of python-dotenv's public API,
+        which is why the dependency is pinned below 2.0.
+        """
+        if not self._pending_writes:
+            return
+        
+        written = set()
+        chunks = []
+        with open(self.env_file, "r", encoding="utf-8") as f:
+            for binding in parse_stream(f):
+                if binding.key in self._pending_writes:
+                    chunks.append(self._format_env_line(binding.key, self._pending_writes[binding.key]))
+                    written.add(binding.key)
+                else:
+                    chunks.append(binding.original.string)
+        
+        content = "".join(chunks)
+        missing = [key for key in self._pending_writes if key not in written]
+        if missing and content and not content.endswith("\n"):
+            content += "\n"
+        content += "".join(self._format_env_line(key, self._pending_writes[key]) for key in missing)
+        
+        Path(self.env_file).write_text(content, encoding="utf-8")
+        self._pending_writes.clear()
+    
+    @staticmethod
+    def _format_env_line(key: str, value: str) -> str:
+        """Format a single ``KEY='value'`` line for the .env file."""
+        escaped = value.replace("'", "\\'")
+        return f"{key}='{escaped}'\n"
     
     def _prompt_for_value(self, key: str, description: str, default: str = "") -> str:
         """Prompt user for a configuration value.
@@ -126,7 +216,7 @@ class Config:
         Returns:
             The configuration value
         """
-        value = os.getenv(key)
+        value = self._env.get(key)
         
         if value is None or value == "":
             # Value is missing, prompt user if interactive
@@ -134,9 +224,7 @@ class Config:
                 value = self._prompt_for_value(key, description, default)
                 # Save the value to .env file
                 if value:
-                    set_key(self.env_file, key, value)
-                    # Reload to pick up the change
-                    load_dotenv(self.env_file, override=True)
+                    self._set_value(key, value)
             else:
                 value = default
         
@@ -4,8 +4,9 @@ This module provides backward compatibility with the original Database class
 by wrapping the new db_utils module that uses DATABASE_URL.
 """
 
+import json
 import sys
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from pathlib import Path
 import db_utils
 
@@ -16,12 +17,13 @@ class Database:
     This class wraps db_utils for backward compatibility with existing code.
     """
 
-    def __init__(self, db_path: str, interactive: bool = True):
+    def __init__(self, db_path: str, interactive: bool = True, fast: bool = False):
         """Initialize database connection.
         
         Args:
             db_path: Path to SQLite database file (or use database_url directly)
             interactive: Whether to prompt for confirmation before creating database
+            fast: Skip SQLite journaling and fsync (for tests and throwaway databases)
         """
         self.db_path = db_path
         self._interactive = interactive
@@ -41,6 +43,13 @@ class Database:
                 print("Database creation cancelled.")
                 sys.exit(0)
         
+        # Share the cached engine for this URL until close() is called
+        db_utils.acquire_engine(self.database_url)
+        self._closed = False
+        
+        if fast:
+            db_utils.enable_fast_mode(self.database_url)
+        
         # Initialize database schema
         self._init_db()
     
@@ -78,15 +87,34 @@ class Database:
         Returns:
             True if inserted, False if updated (duplicate)
         """
-        # Convert dict to JSON string if needed
-        if isinstance(score_dictionary, dict):
-            import json
-            score_dictionary = json.dumps(score_dictionary)
-        
-        return db_utils.insert_idea(
-            self.database_url, source, source_id, title,
-            description, tags, score, score_dictionary
-        )
+        return self.insert_ideas([{
+            'source': source,
+            'source_id': source_id,
+            'title': title,
+            'description': description,
+            'tags': tags,
+            'score': score,
+            'score_dictionary': score_dictionary,
+        }]) == 1
+    
+    def insert_ideas(self, ideas: Iterable[Dict[str, Any]]) -> int:
+        """Insert or update multiple ideas in a single transaction.
+        
+        Args:
+            ideas: Idea dictionaries using the same keys as insert_idea() arguments
+            
+        Returns:
+            Number of ideas inserted; the remainder updated existing records
+        """
+        rows = []
+        for idea in ideas:
+            # Convert dict to JSON string if needed
+            score_dictionary = idea.get('score_dictionary')
+            if isinstance(score_dictionary, dict):
+                score_dictionary = json.dumps(score_dictionary)
+            rows.append({**idea, 'score_dictionary': score_dictionary})
+        
+        return db_utils.insert_ideas(self.database_url, rows)
     
     def get_idea(self, source: str, source_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific idea by source and source_id.
@@ -141,8 +169,14 @@ class Database:
         return db_utils.count_by_source(self.database_url, source)
     
     def close(self):
-        """Close database connection (no-op for backward compatibility)."""
-        pass
+        """Close database connection.
+        
+        The shared engine is disposed once every Database on the same URL
+        has been closed. Closing more than once has no further effect.
+        """
+        if not self._closed:
+            self._closed = True
+            db_utils.release_engine(self.database_url)
     
     def __enter__(self):
         """Context manager entry."""
@@ -4,14 +4,70 @@ This module provides direct database access using SQLAlchemy Core (not ORM)
 with connection configured via DATABASE_URL environment variable.
 """
 
-from sqlalchemy import create_engine, text, MetaData, Table, Column, Integer, String, Float, DateTime, Text, Boolean
+import logging
+from sqlalchemy import create_engine, text, bindparam, inspect, MetaData, Table, Column, Integer, String, Float, DateTime, Text, Boolean, Index
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Set, Tuple
 from datetime import datetime, timezone
 
 
+logger = logging.getLogger(__name__)
+
+
+# Engines cached per DATABASE_URL (see get_engine/release_engine/dispose_engine)
+_engines: Dict[str, Any] = {}
+
+# Number of owners holding each cached engine (see acquire_engine/release_engine)
+_engine_owners: Dict[str, int] = {}
+
+# URLs whose schema was created through their cached engine (see init_database)
+_initialized: Set[str] = set()
+
+# SQLite settings that trade durability for speed (see enable_fast_mode)
+_FAST_SQLITE_PRAGMAS = (
+    "journal_mode=MEMORY",
+    "synchronous=OFF",
+    "temp_store=MEMORY",
+    "locking_mode=EXCLUSIVE",
+    "cache_size=-65536",  # 64 MiB page cache
+    "mmap_size=268435456",  # 256 MiB memory-mapped I/O
+)
+
+# Statements with a fixed shape are built once and reused by every call
+_SELECT_EXISTING_SOURCE_IDS = text(
+    "SELECT source_id FROM YouTubeShortsSource WHERE source = :source AND source_id IN :source_ids"
+).bindparams(bindparam("source_ids", expanding=True))
+
+_INSERT_IDEA = text("""
+    INSERT INTO YouTubeShortsSource
+    (source, source_id, title, description, tags, score, score_dictionary, processed, created_at, updated_at)
+    VALUES (:source, :source_id, :title, :description, :tags, :score, :score_dictionary, :processed, :created_at, :updated_at)
+""")
+
+_UPDATE_IDEA = text("""
+    UPDATE YouTubeShortsSource
+    SET title = :title, description = :description, tags = :tags,
+        score = :score, score_dictionary = :score_dictionary, updated_at = :updated_at
+    WHERE source = :source AND source_id = :source_id
+""")
+
+_MARK_PROCESSED = text("UPDATE YouTubeShortsSource SET processed = 1, updated_at = :updated_at WHERE id = :id")
+
+_COUNT_IDEAS = text("SELECT COUNT(*) as count FROM YouTubeShortsSource")
+
+# Keeps the newest row for each (source, source_id) pair
+_DELETE_DUPLICATE_IDEAS = text("""
+    DELETE FROM YouTubeShortsSource
+    WHERE id NOT IN (
+        SELECT MAX(id) FROM YouTubeShortsSource GROUP BY source, source_id
+    )
+""")
+
+_COUNT_BY_SOURCE = text("SELECT COUNT(*) as count FROM YouTubeShortsSource WHERE source = :source")
+
+
 def utc_now():
     """Get current UTC time."""
     return datetime.now(timezone.utc)
@@ -20,33 +76,115 @@ def utc_now():
 def get_engine(database_url: str):
     """Get SQLAlchemy engine from DATABASE_URL.
     
+    Engines are created once per URL and reused by every helper in this
+    module. For SQLite this keeps a single connection open, so an in-memory
+    database (``sqlite:///:memory:``) persists until its last owner calls
+    release_engine() or dispose_engine() is called.
+    
     Args:
         database_url: Database URL (e.g., sqlite:///db.s3db)
         
     Returns:
         SQLAlchemy engine
     """
+    engine = _engines.get(database_url)
+    if engine is not None:
+        return engine
+    
     # For SQLite, ensure parent directory exists
     if database_url.startswith("sqlite:///"):
         db_path = database_url.replace("sqlite:///", "")
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         # Use StaticPool for SQLite to avoid threading issues
-        return create_engine(database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        engine = create_engine(database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool)
     else:
-        return create_engine(database_url)
+        engine = create_engine(database_url)
+    
+    _engines[database_url] = engine
+    return engine
+
+
+def dispose_engine(database_url: str):
+    """Dispose the cached engine for DATABASE_URL and close its connections.
+    
+    Args:
+        database_url: Database URL
+    """
+    _initialized.discard(database_url)
+    _engine_owners.pop(database_url, None)
+    engine = _engines.pop(database_url, None)
+    if engine is not None:
+        engine.dispose()
+
+
+def acquire_engine(database_url: str):
+    """Get the cached engine for DATABASE_URL and register one more owner.
+    
+    Each call must be paired with release_engine(), which only disposes the
+    engine once its last owner has released it.
+    
+    Args:
+        database_url: Database URL
+        
+    Returns:
+        SQLAlchemy engine
+    """
+    _engine_owners[database_url] = _engine_owners.get(database_url, 0) + 1
+    return get_engine(database_url)
+
+
+def release_engine(database_url: str):
+    """Release one owner of the cached engine for DATABASE_URL.
+    
+    The engine is disposed when no owners remain, so other owners on the
+    same URL keep a working connection (and in-memory data).
+    
+    Args:
+        database_url: Database URL
+    """
+    remaining = _engine_owners.get(database_url, 0) - 1
+    if remaining > 0:
+        _engine_owners[database_url] = remaining
+    else:
+        dispose_engine(database_url)
+
+
+def enable_fast_mode(database_url: str):
+    """Disable on-disk journaling and fsync for a SQLite database.
+    
+    Intended for throwaway databases such as test fixtures: a crash may
+    corrupt the file. The PRAGMAs apply to the connection held by the cached
+    engine, so they stay in effect until dispose_engine() is called.
+    Non-SQLite URLs are left unchanged.
+    
+    Args:
+        database_url: Database URL
+    """
+    if not database_url.startswith("sqlite"):
+        return
+    
+    with get_connection(database_url) as conn:
+        for pragma in _FAST_SQLITE_PRAGMAS:
+            conn.exec_driver_sql(f"PRAGMA {pragma}")
 
 
 def init_database(database_url: str):
     """Initialize database schema.
     
+    The schema is only checked once per cached engine; later calls for the
+    same URL return immediately until dispose_engine() is called.
+    
     Args:
         database_url: Database URL
     """
+    if database_url in _initialized:
+        return
+    
     engine = get_engine(database_url)
     metadata = MetaData()
     
     # Define YouTubeShortsSource table
-    Table(
+    table = Table(
         'YouTubeShortsSource',
         metadata,
         Column('id', Integer, primary_key=True, autoincrement=True),
@@ -60,10 +198,34 @@ def init_database(database_url: str):
         Column('processed', Boolean, default=False, nullable=False, index=True),
         Column('created_at', DateTime, default=utc_now, nullable=False),
         Column('updated_at', DateTime, default=utc_now, onupdate=utc_now, nullable=False),
+        # Backs the duplicate check in insert_ideas()
+        Index('ix_source_source_id', 'source', 'source_id', unique=True),
     )
     
     # Create all tables
     metadata.create_all(engine)
+    
+    # create_all() skips indexes of tables that already exist, so add the
+    # composite index to databases created before it was introduced
+    existing_indexes = {index["name"] for index in inspect(engine).get_indexes(table.name)}
+    for index in table.indexes:
+        if index.name in existing_indexes:
+            continue
+        if index.unique:
+            # Older versions could store the same idea twice; keep the newest
+            # copy so the unique index can be built
+            with get_connection(database_url) as conn:
+                removed = conn.execute(_DELETE_DUPLICATE_IDEAS).rowcount
+                conn.commit()
+            if removed:
+                logger.warning(
+                    "Removed %d duplicate idea row(s) from %s before creating %s; "
+                    "the newest row for each (source, source_id) was kept",
+                    removed, database_url, index.name
+                )
+        index.create(engine)
+    
+    _initialized.add(database_url)
 
 
 @contextmanager
@@ -100,61 +262,105 @@ def insert_idea(database_url: str, source: str, source_id: str, title: str,
         score_dictionary: JSON string of score components
         
     Returns:
-        True if inserted/updated, False if error
+        True if inserted, False if an existing record was updated
     """
+    return insert_ideas(database_url, [{
+        "source": source,
+        "source_id": source_id,
+        "title": title,
+        "description": description,
+        "tags": tags,
+        "score": score,
+        "score_dictionary": score_dictionary,
+    }]) == 1
+
+
+# Maximum number of source IDs bound into a single IN (...) lookup
+_KEY_LOOKUP_CHUNK = 500
+
+
+def _find_existing_keys(conn, keys: Iterable[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+    """Find which (source, source_id) pairs already exist.
+    
+    IDs are looked up per source with IN queries rather than one SELECT per
+    record.
+    
+    Args:
+        conn: Open database connection
+        keys: (source, source_id) pairs to look up
+        
+    Returns:
+        Set of the pairs that exist in the database
+    """
+    ids_by_source: Dict[str, List[str]] = {}
+    for source, source_id in keys:
+        ids_by_source.setdefault(source, []).append(source_id)
+    
+    existing = set()
+    for source, source_ids in ids_by_source.items():
+        for start in range(0, len(source_ids), _KEY_LOOKUP_CHUNK):
+            result = conn.execute(_SELECT_EXISTING_SOURCE_IDS, {
+                "source": source,
+                "source_ids": source_ids[start:start + _KEY_LOOKUP_CHUNK],
+            })
+            existing.update((source, row[0]) for row in result)
+    return existing
+
+
+def insert_ideas(database_url: str, ideas: Iterable[Dict[str, Any]]) -> int:
+    """Insert or update multiple ideas in a single transaction.
+    
+    Existing records are found with a batched key lookup, then new and
+    existing records are each written with one executemany call, followed
+    by a single commit. The lookup is served by the unique
+    ``ix_source_source_id`` index, which also rejects a duplicate
+    (source, source_id) insert if another writer added it after the lookup.
+    
+    Args:
+        database_url: Database URL
+        ideas: Idea dictionaries with keys source, source_id and title, and
+            optionally description, tags, score and score_dictionary (JSON string)
+        
+    Returns:
+        Number of ideas inserted; the remainder updated existing records
+    """
+    now = utc_now()
+    inserts = []
+    updates = []
+    rows = [
+        {
+            "source": idea["source"],
+            "source_id": idea["source_id"],
+            "title": idea["title"],
+            "description": idea.get("description"),
+            "tags": idea.get("tags"),
+            "score": idea.get("score"),
+            "score_dictionary": idea.get("score_dictionary"),
+            "updated_at": now,
+        }
+        for idea in ideas
+    ]
+    
     with get_connection(database_url) as conn:
-        # Check if record exists
-        result = conn.execute(
-            text("SELECT id FROM YouTubeShortsSource WHERE source = :source AND source_id = :source_id"),
-            {"source": source, "source_id": source_id}
-        )
-        existing = result.fetchone()
+        existing = _find_existing_keys(conn, {(row["source"], row["source_id"]) for row in rows})
+        
+        for params in rows:
+            key = (params["source"], params["source_id"])
+            
+            # Repeats within the batch update the row inserted earlier in it
+            if key in existing:
+                updates.append(params)
+            else:
+                inserts.append({**params, "processed": False, "created_at": now})
+                existing.add(key)
         
-        if existing:
-            # Update existing record
-            conn.execute(
-                text("""
-                    UPDATE YouTubeShortsSource
-                    SET title = :title, description = :description, tags = :tags,
-                        score = :score, score_dictionary = :score_dictionary, updated_at = :updated_at
-                    WHERE source = :source AND source_id = :source_id
-                """),
-                {
-                    "title": title,
-                    "description": description,
-                    "tags": tags,
-                    "score": score,
-                    "score_dictionary": score_dictionary,
-                    "updated_at": utc_now(),
-                    "source": source,
-                    "source_id": source_id
-                }
-            )
-            conn.commit()
-            return False  # Not inserted, updated
-        else:
-            # Insert new record
-            conn.execute(
-                text("""
-                    INSERT INTO YouTubeShortsSource
-                    (source, source_id, title, description, tags, score, score_dictionary, processed, created_at, updated_at)
-                    VALUES (:source, :source_id, :title, :description, :tags, :score, :score_dictionary, :processed, :created_at, :updated_at)
-                """),
-                {
-                    "source": source,
-                    "source_id": source_id,
-                    "title": title,
-                    "description": description,
-                    "tags": tags,
-                    "score": score,
-                    "score_dictionary": score_dictionary,
-                    "processed": False,
-                    "created_at": utc_now(),
-                    "updated_at": utc_now()
-                }
-            )
-            conn.commit()
-            return True  # Inserted
+        if inserts:
+            conn.execute(_INSERT_IDEA, inserts)
+        if updates:
+            conn.execute(_UPDATE_IDEA, updates)
+        conn.commit()
+    
+    return len(inserts)
 
 
 def get_unprocessed_records(database_url: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -185,10 +391,7 @@ def mark_as_processed(database_url: str, record_id: int):
         record_id: Record ID to mark as processed
     """
     with get_connection(database_url) as conn:
-        conn.execute(
-            text("UPDATE YouTubeShortsSource SET processed = 1, updated_at = :updated_at WHERE id = :id"),
-            {"updated_at": utc_now(), "id": record_id}
-        )
+        conn.execute(_MARK_PROCESSED, {"updated_at": utc_now(), "id": record_id})
         conn.commit()
 
 
@@ -225,7 +428,7 @@ def count_ideas(database_url: str) -> int:
         Total count
     """
     with get_connection(database_url) as conn:
-        result = conn.execute(text("SELECT COUNT(*) as count FROM YouTubeShortsSource"))
+        result = conn.execute(_COUNT_IDEAS)
         return result.fetchone()[0]
 
 
@@ -240,8 +443,5 @@ def count_by_source(database_url: str, source: str) -> int:
         Count for source
     """
     with get_connection(database_url) as conn:
-        result = conn.execute(
-            text("SELECT COUNT(*) as count FROM YouTubeShortsSource WHERE source = :source"),
-            {"source": source}
-        )
+        result = conn.execute(_COUNT_BY_SOURCE, {"source": source})
         return result.fetchone()[0]
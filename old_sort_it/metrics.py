@@ -6,12 +6,32 @@ multiple platforms: YouTube, Reddit, Facebook, Instagram, TikTok, etc.
 Inspired by comprehensive analytics tools like VidIQ and TubeBuddy.
 """
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
+from functools import partial
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 
-@dataclass
+def _as_int(value: Any) -> int:
+    """Coerce a count to int, skipping the cast when it already is one.
+    
+    YouTube API statistics arrive as strings, while pre-parsed statistics
+    (e.g. from yt-dlp) are already ints; ``type() is int`` keeps the common
+    case to a single identity check.
+    """
+    return value if type(value) is int else int(value or 0)
+
+
+# YouTube API statistics keys mapped to the integer count fields they fill
+_YOUTUBE_COUNT_FIELDS = (
+    ('viewCount', 'view_count'),
+    ('likeCount', 'like_count'),
+    ('commentCount', 'comment_count'),
+    ('favoriteCount', 'favorite_count'),
+)
+
+
+@dataclass(slots=True)
 class UniversalMetrics:
     """Universal metrics schema for cross-platform content analysis.
     
@@ -83,14 +103,19 @@ class UniversalMetrics:
         """Calculate derived metrics from raw data."""
         # Engagement rate: (likes + comments + shares) / views * 100
         if self.view_count > 0:
-            total_engagement = self.like_count + self.comment_count + self.share_count
-            self.engagement_rate = (total_engagement / self.view_count) * 100
+            # All ratios are percentages of views, so share a single reciprocal
+            per_view = 100.0 / self.view_count
+            like_count = self.like_count
+            comment_count = self.comment_count
+            share_count = self.share_count
+            
+            self.engagement_rate = (like_count + comment_count + share_count) * per_view
             
             # Individual ratios
-            self.like_to_view_ratio = (self.like_count / self.view_count) * 100
-            self.comment_to_view_ratio = (self.comment_count / self.view_count) * 100
-            if self.share_count > 0:
-                self.share_to_view_ratio = (self.share_count / self.view_count) * 100
+            self.like_to_view_ratio = like_count * per_view
+            self.comment_to_view_ratio = comment_count * per_view
+            if share_count > 0:
+                self.share_to_view_ratio = share_count * per_view
         
         # Performance metrics
         if self.days_since_upload and self.days_since_upload > 0:
@@ -100,9 +125,19 @@ class UniversalMetrics:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert metrics to dictionary, excluding None values."""
-        result = asdict(self)
-        # Remove None values for cleaner storage
-        return {k: v for k, v in result.items() if v is not None and v != [] and v != {}}
+        # Remove None values and empty containers for cleaner storage
+        result = {}
+        for name in _FIELDS:
+            value = getattr(self, name)
+            if value is None or value == [] or value == {}:
+                continue
+            # Copy containers so callers cannot mutate the instance through the result
+            if isinstance(value, dict):
+                value = dict(value)
+            elif isinstance(value, list):
+                value = list(value)
+            result[name] = value
+        return result
     
     @classmethod
     def from_youtube(cls, video_data: Dict[str, Any], snippet: Dict[str, Any] = None, 
@@ -124,13 +159,15 @@ class UniversalMetrics:
         fps = enhanced_metrics.get('fps')
         aspect_ratio = enhanced_metrics.get('aspect_ratio')
         
+        # Coerce API statistics (strings) to counts in one pass
+        counts = {name: _as_int(statistics.get(key, 0)) for key, name in _YOUTUBE_COUNT_FIELDS}
+        dislike_count = statistics.get('dislikeCount')
+        category_id = snippet.get('categoryId')
+        
         metrics = cls(
             platform="youtube",
-            view_count=int(statistics.get('viewCount', 0)),
-            like_count=int(statistics.get('likeCount', 0)),
-            comment_count=int(statistics.get('commentCount', 0)),
-            dislike_count=int(statistics.get('dislikeCount', 0)) if statistics.get('dislikeCount') else None,
-            favorite_count=int(statistics.get('favoriteCount', 0)),
+            **counts,
+            dislike_count=_as_int(dislike_count) if dislike_count else None,
             
             # Content metadata
             title_length=len(snippet.get('title', '')),
@@ -148,7 +185,7 @@ class UniversalMetrics:
             
             # Platform data
             upload_date=snippet.get('publishedAt'),
-            categories=[snippet.get('categoryId')] if snippet.get('categoryId') else [],
+            categories=[category_id] if category_id else [],
             
             # Store full data for reference
             platform_specific={
@@ -174,25 +211,16 @@ class UniversalMetrics:
         Args:
             post_data: Reddit post data (from PRAW or dict)
         """
-        # Handle both PRAW objects and dictionaries
-        if hasattr(post_data, '__dict__'):
-            # PRAW object
-            view_count = getattr(post_data, 'num_views', 0) or 0
-            score = getattr(post_data, 'score', 0)
-            ups = getattr(post_data, 'ups', 0)
-            num_comments = getattr(post_data, 'num_comments', 0)
-            upvote_ratio = getattr(post_data, 'upvote_ratio', 0)
-            title = getattr(post_data, 'title', '')
-            selftext = getattr(post_data, 'selftext', '')
-        else:
-            # Dictionary
-            view_count = post_data.get('num_views', 0) or 0
-            score = post_data.get('score', 0)
-            ups = post_data.get('ups', 0)
-            num_comments = post_data.get('num_comments', 0)
-            upvote_ratio = post_data.get('upvote_ratio', 0)
-            title = post_data.get('title', '')
-            selftext = post_data.get('selftext', '')
+        # Handle both PRAW objects (attributes) and dictionaries (keys)
+        get = partial(getattr, post_data) if hasattr(post_data, '__dict__') else post_data.get
+        
+        view_count = get('num_views', None) or 0
+        score = get('score', 0)
+        ups = get('ups', 0)
+        num_comments = get('num_comments', 0)
+        upvote_ratio = get('upvote_ratio', 0)
+        title = get('title', '')
+        selftext = get('selftext', '')
         
         metrics = cls(
             platform="reddit",
@@ -280,3 +308,7 @@ class UniversalMetrics:
         
         metrics.calculate_derived_metrics()
         return metrics
+
+
+# Field names in declaration order, resolved once for to_dict()
+_FIELDS = tuple(f.name for f in fields(UniversalMetrics))